@@ -1,7 +1,8 @@
 """Application configuration settings."""
 
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Tuple
 
 
 class Settings(BaseSettings):
@@ -10,10 +11,19 @@ class Settings(BaseSettings):
 
     Attributes:
         DATABASE_URL: PostgreSQL database connection URL
+        DB_POOL_PRE_PING: Test connections with SELECT 1 on checkout; only
+            worth enabling when idle connections are dropped unpredictably
+        DB_POOL_SIZE: Number of persistent connections in the pool
+        DB_MAX_OVERFLOW: Extra connections allowed beyond the pool size
+        DB_POOL_RECYCLE: Seconds before a pooled connection is recycled
+        DB_POOL_TIMEOUT: Seconds to wait for a connection from the pool
+        DB_PGBOUNCER: Disable asyncpg prepared statement caches, required
+            behind PgBouncer in transaction pooling mode
         KEYCLOAK_URL: Keycloak server URL
         KEYCLOAK_REALM: Keycloak realm name
         KEYCLOAK_CLIENT_ID: Keycloak client ID for backend
         KEYCLOAK_CLIENT_SECRET: Keycloak client secret for backend
+        KEYCLOAK_ADMIN_ROLE: Realm or client role required for admin endpoints
         APP_HOST: Application host address
         APP_PORT: Application port
         CORS_ORIGINS: Comma-separated list of allowed CORS origins
@@ -26,6 +36,12 @@ class Settings(BaseSettings):
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "postgres"
     DB_NAME: str = "multitenantauth"
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    DB_PGBOUNCER: bool = False
 
     # Keycloak settings
     KEYCLOAK_URL: str = "http://localhost:8080"  # URL interna (para server-to-server)
@@ -33,6 +49,7 @@ class Settings(BaseSettings):
     KEYCLOAK_REALM: str = "multi-tenant-app"
     KEYCLOAK_CLIENT_ID: str = "fastapi-backend"
     KEYCLOAK_CLIENT_SECRET: str
+    KEYCLOAK_ADMIN_ROLE: str = "tenant-admin"
 
     # Application settings
     APP_HOST: str = "0.0.0.0"
@@ -40,37 +57,41 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:3000"
     OAUTH_REDIRECT_URI: str = "http://localhost:3000/auth/callback"
 
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Convert comma-separated CORS origins to list."""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Normalized CORS origins (stripped, lowercase, no trailing slash)."""
+        return tuple(
+            origin.strip().rstrip("/").lower()
+            for origin in self.CORS_ORIGINS.split(",")
+            if origin.strip()
+        )
 
-    @property
+    @cached_property
     def token_url(self) -> str:
         """Keycloak token endpoint URL."""
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}/protocol/openid-connect/token"
 
-    @property
+    @cached_property
     def auth_url(self) -> str:
         """Keycloak authorization endpoint URL (pública para el navegador)."""
         return f"{self.KEYCLOAK_PUBLIC_URL}/realms/{self.KEYCLOAK_REALM}/protocol/openid-connect/auth"
 
-    @property
+    @cached_property
     def logout_url(self) -> str:
         """Keycloak logout endpoint URL."""
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}/protocol/openid-connect/logout"
 
-    @property
+    @cached_property
     def certs_url(self) -> str:
         """Keycloak certs endpoint URL for JWT validation."""
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}/protocol/openid-connect/certs"
 
-    @property
+    @cached_property
     def userinfo_url(self) -> str:
         """Keycloak userinfo endpoint URL."""
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}/protocol/openid-connect/userinfo"
     
-    @property
+    @cached_property
     def KEYCLOAK_ISSUER(self) -> str:
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}"
     
@@ -1,47 +1,62 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
 from urllib.parse import quote_plus
-from dotenv import load_dotenv
-import os
+import asyncio
 
-load_dotenv()
+from app.config import settings
 
 Base = declarative_base()
 
+# Engine and session factories are created once, at import time
+engine = create_async_engine(
+    f'postgresql+asyncpg://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}'
+    f'@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}',
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=1200,
+    # PgBouncer in transaction mode hands each transaction a different server
+    # connection, so statements prepared on one are missing on the next
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if settings.DB_PGBOUNCER
+        else {}
+    ),
+)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+# One session per asyncio task, i.e. per request
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=asyncio.current_task)
+
+
 class DatabaseConnectionORM:
-    _engine = None
-    _Session = None
-
-    def __init__(self):
-        if not DatabaseConnectionORM._engine:
-            host = os.getenv('DB_HOST', 'localhost')
-            port = os.getenv('DB_PORT', '5432')
-            user = os.getenv('DB_USER', 'postgres')
-            password = os.getenv('DB_PASSWORD', 'password')
-            db = os.getenv('DB_NAME', 'inventary')
-
-            try:
-                DatabaseConnectionORM._engine = create_engine(
-                    f'postgresql+psycopg2://{user}:{quote_plus(password)}@{host}:{port}/{db}',
-                    pool_size=10,
-                    max_overflow=20,
-                    pool_timeout=30,
-                    pool_recycle=1800,
-                    pool_pre_ping=True
-                )
-                DatabaseConnectionORM._Session = sessionmaker(bind=DatabaseConnectionORM._engine)
-            except Exception as e:
-                print(f'Error connecting to the database: {e}')
+    """Thin facade over the module-level engine and session factories."""
 
     def get_base(self):
         return Base
-    
+
     def get_engine(self):
-        return DatabaseConnectionORM._engine
+        return engine
 
     def get_session(self):
-        return DatabaseConnectionORM._Session()
+        return SessionLocal()
+
+    def get_scoped_session(self):
+        return ScopedSession()
+
+    async def remove_scoped_session(self):
+        await ScopedSession.remove()
 
-    def close(self):
-        if DatabaseConnectionORM._engine:
-            DatabaseConnectionORM._engine.dispose()
\ No newline at end of file
+    async def close(self):
+        await engine.dispose()
@@ -2,12 +2,23 @@
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import Generator
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from cachetools import TTLCache
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncGenerator, Dict, Any, Optional, Set, Tuple
+import asyncio
+import hashlib
 import logging
+import time
+import uuid
 
+from app.config import settings
 from app.db.Database_Connection_ORM import DatabaseConnectionORM
 from app.services.keycloak_service import keycloak_service
+from app.models.tenant import Tenant
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -18,51 +29,221 @@ security = HTTPBearer()
 # Database connection instance
 db_connection = DatabaseConnectionORM()
 
+# Decoded JWT claims keyed by SHA-256 of the raw token: (expires_at, claims)
+TOKEN_CACHE_TTL = 30
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL)
+# In-flight verifications keyed by token hash, awaited by concurrent misses
+_token_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
 
-def get_db() -> Generator[Session, None, None]:
+# Detached user snapshots keyed by Keycloak user ID (sub claim)
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+
+
+@dataclass(frozen=True)
+class CurrentTenant:
+    """Detached snapshot of a tenant, safe to cache across sessions."""
+
+    id: uuid.UUID
+    name: str
+    identifier: str
+    keycloak_idp_alias: str
+    status: str
+
+    @classmethod
+    def from_tenant(cls, tenant: Tenant) -> "CurrentTenant":
+        """Build a snapshot from a Tenant database model."""
+        return cls(
+            id=tenant.id,
+            name=tenant.name,
+            identifier=tenant.identifier,
+            keycloak_idp_alias=tenant.keycloak_idp_alias,
+            status=tenant.status,
+        )
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """
+    Detached snapshot of an authenticated user.
+
+    Holds the user fields read by the routers so it can be cached and
+    shared across requests without being bound to a database session.
+    """
+
+    id: uuid.UUID
+    tenant_id: uuid.UUID
+    keycloak_user_id: str
+    email: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    department: str
+    status: str
+    last_login: Optional[datetime]
+    tenant: Optional[CurrentTenant]
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        """Build a snapshot from a User database model with its tenant loaded."""
+        return cls(
+            id=user.id,
+            tenant_id=user.tenant_id,
+            keycloak_user_id=user.keycloak_user_id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            department=user.department,
+            status=user.status,
+            last_login=user.last_login,
+            tenant=CurrentTenant.from_tenant(user.tenant) if user.tenant else None,
+        )
+
+
+def invalidate_cached_user(keycloak_user_id: str) -> None:
+    """Drop the cached snapshot for a user after it changes in the database."""
+    _user_cache.pop(keycloak_user_id, None)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
 
     Yields:
-        Session: SQLAlchemy database session
+        AsyncSession: SQLAlchemy session scoped to the current request task
 
     Note:
-        Automatically closes the session after use
+        Automatically removes the scoped session after use
     """
-    db = db_connection.get_session()
+    db = db_connection.get_scoped_session()
     try:
         yield db
     except Exception as e:
-        logger.error(f"Database session error: {str(e)}")
-        db.rollback()
+        logger.error("Database session error: %s", e)
+        await db.rollback()
         raise
     finally:
-        db.close()
+        await db_connection.remove_scoped_session()
 
 
-async def get_current_user(
+def _get_cached_token(key: str) -> Optional[Dict[str, Any]]:
+    """Return cached claims for a token hash if they have not expired."""
+    entry: Optional[Tuple[float, Dict[str, Any]]] = _token_cache.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+    return None
+
+
+async def decode_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Decode a JWT, reusing the claims of a recent successful validation.
+
+    Entries live at most ``TOKEN_CACHE_TTL`` seconds and never past the
+    token's ``exp`` claim. Failed validations are not cached, and concurrent
+    misses for the same token share a single verification.
+
+    Args:
+        token: JWT access token
+
+    Returns:
+        Dict containing decoded token claims
+
+    Raises:
+        Exception: If token validation fails
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+
+    decoded_token = _get_cached_token(key)
+    if decoded_token is not None:
+        return decoded_token
+
+    while True:
+        inflight = _token_inflight.get(key)
+        if inflight is None:
+            break
+        try:
+            # Shielded so a cancelled waiter does not cancel the shared verification
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise
+            # The verifying request was cancelled; retry, possibly as the verifier
+            decoded_token = _get_cached_token(key)
+            if decoded_token is not None:
+                return decoded_token
+
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+    _token_inflight[key] = future
+    try:
+        decoded_token = await keycloak_service.decode_token(token)
+
+        now = time.time()
+        expires_at = min(now + TOKEN_CACHE_TTL, decoded_token.get("exp", now))
+        if expires_at > now:
+            _token_cache[key] = (expires_at, decoded_token)
+
+        future.set_result(decoded_token)
+        return decoded_token
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved in case no request was waiting
+        future.exception()
+        raise
+    finally:
+        # Only the creator removes the entry, after the cache has been filled
+        if _token_inflight.get(key) is future:
+            del _token_inflight[key]
+
+
+async def get_token_claims(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+) -> Dict[str, Any]:
     """
-    Dependency that extracts and validates the current authenticated user.
+    Dependency that verifies the Bearer token and returns its claims.
+
+    FastAPI caches dependency results per request, so every dependency that
+    needs the claims shares this single verification.
 
     Args:
         credentials: HTTP Authorization credentials containing Bearer token
+
+    Returns:
+        Dict with the decoded token claims
+
+    Raises:
+        HTTPException: If the token is invalid
+    """
+    try:
+        return await decode_token_cached(credentials.credentials)
+    except Exception as e:
+        logger.error("Authentication error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Authentication failed: {str(e)}",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_current_user(
+    decoded_token: Dict[str, Any] = Depends(get_token_claims),
+    db: AsyncSession = Depends(get_db),
+) -> CurrentUser:
+    """
+    Dependency that extracts and validates the current authenticated user.
+
+    Args:
+        decoded_token: Verified token claims
         db: Database session
 
     Returns:
-        User: Authenticated user object from database
+        CurrentUser: Snapshot of the authenticated user from database
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-
     try:
-        # Decode and validate token
-        decoded_token = await keycloak_service.decode_token(token)
-
         # Extract Keycloak user ID (sub claim)
         keycloak_user_id = decoded_token.get("sub")
         if not keycloak_user_id:
@@ -72,32 +253,82 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Find user in database
-        user = db.query(User).filter(User.keycloak_user_id == keycloak_user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found in database",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Find active user in cache, falling back to the database
+        user = _user_cache.get(keycloak_user_id)
+        if user is None:
+            db_user = (
+                await db.execute(
+                    select(User)
+                    .options(joinedload(User.tenant))
+                    .where(
+                        User.keycloak_user_id == keycloak_user_id,
+                        User.status == "active",
+                    )
+                )
+            ).scalar_one_or_none()
+            if not db_user:
+                # Rare path: tell an inactive account apart from a missing one
+                user_exists = await db.scalar(
+                    select(exists().where(User.keycloak_user_id == keycloak_user_id))
+                )
+                if user_exists:
+                    raise HTTPException(
+                        status_code=status.HTTP_403_FORBIDDEN,
+                        detail="User account is not active",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found in database",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            user = CurrentUser.from_user(db_user)
+            _user_cache[keycloak_user_id] = user
 
-        # Check user status
-        if user.status != "active":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User account is not active",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        logger.info(f"Authenticated user: {user.email}")
+        logger.debug("Authenticated user: %s", user.email)
         return user
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Authentication error: {str(e)}")
+        logger.error("Authentication error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Authentication failed: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+def _token_roles(claims: Dict[str, Any]) -> Set[str]:
+    """Collect the realm roles and this client's roles from token claims."""
+    roles = set(claims.get("realm_access", {}).get("roles", []))
+    client_access = claims.get("resource_access", {})
+    roles.update(client_access.get(settings.KEYCLOAK_CLIENT_ID, {}).get("roles", []))
+    return roles
+
+
+async def get_current_admin(
+    decoded_token: Dict[str, Any] = Depends(get_token_claims),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
+    """
+    Dependency that requires the authenticated user to hold the admin role.
+
+    Args:
+        decoded_token: Verified token claims
+        current_user: Authenticated user from token
+
+    Returns:
+        CurrentUser: Snapshot of the authenticated admin user
+
+    Raises:
+        HTTPException: If the token lacks the configured admin role
+    """
+    if settings.KEYCLOAK_ADMIN_ROLE not in _token_roles(decoded_token):
+        logger.warning("Admin access denied for user: %s", current_user.email)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin role required",
+        )
+
+    return current_user
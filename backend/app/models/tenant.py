@@ -1,6 +1,6 @@
 """Tenant database model."""
 
-from sqlalchemy import Column, String, DateTime, text
+from sqlalchemy import Column, String, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -42,6 +42,16 @@ class Tenant(Base):
     # Relationships
     users = relationship("User", back_populates="tenant", cascade="all, delete-orphan")
 
+    # Indexes
+    __table_args__ = (
+        # Serves identifier lookups restricted to active tenants
+        Index(
+            "ix_tenants_identifier_active",
+            "identifier",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Tenant(id={self.id}, name={self.name}, identifier={self.identifier})>"
 
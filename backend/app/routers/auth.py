@@ -1,12 +1,24 @@
 """Authentication router with OAuth2 endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from cachetools import TTLCache
+from datetime import datetime, timezone
+from typing import Optional
 from urllib.parse import urlencode
 import logging
-
-from app.dependencies import get_db, get_current_user
+import uuid
+
+from app.dependencies import (
+    db_connection,
+    get_db,
+    get_current_user,
+    get_current_admin,
+    invalidate_cached_user,
+    CurrentUser,
+)
 from app.services.keycloak_service import keycloak_service
 from app.models.tenant import Tenant
 from app.models.user import User
@@ -18,14 +30,112 @@ from app.schemas.auth import (
     RefreshTokenRequest,
     LogoutRequest,
     LogoutResponse,
+    ClearTenantCacheResponse,
 )
-from app.schemas.user import UserResponse, TenantResponse
+from app.schemas.user import UserResponse
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Identify-tenant responses for active tenants, keyed by identifier (department)
+_tenant_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+_TENANT_NOT_FOUND = IdentifyTenantResponse(
+    tenant_found=False,
+    tenant_name=None,
+    tenant_id=None,
+    keycloak_auth_url=None,
+)
+
+
+def _build_auth_url(idp_alias: str) -> str:
+    """
+    Build the Keycloak authorization URL with an IDP hint.
+
+    Args:
+        idp_alias: Keycloak Identity Provider alias of the tenant
+
+    Returns:
+        Keycloak authorization URL
+    """
+    auth_params = {
+        "client_id": settings.KEYCLOAK_CLIENT_ID,
+        "response_type": "code",
+        "redirect_uri": settings.OAUTH_REDIRECT_URI,
+        "kc_idp_hint": idp_alias,
+    }
+    return f"{settings.auth_url}?{urlencode(auth_params)}"
+
+
+async def _identify_tenant(
+    db: AsyncSession, identifier: str
+) -> Optional[IdentifyTenantResponse]:
+    """
+    Find an active tenant by identifier, serving repeated lookups from memory.
+
+    The tenant's Keycloak authorization URL is built when the entry is cached,
+    so a cache hit needs neither the database nor any string building. Only
+    hits are cached so a newly created tenant is found immediately.
+
+    Args:
+        db: Database session
+        identifier: Tenant identifier (department)
+
+    Returns:
+        IdentifyTenantResponse for the tenant, or None if no active tenant matches
+    """
+    response = _tenant_cache.get(identifier)
+    if response is None:
+        tenant = (
+            await db.execute(
+                select(Tenant).where(
+                    Tenant.identifier == identifier, Tenant.status == "active"
+                )
+            )
+        ).scalars().first()
+        if not tenant:
+            return None
+        response = IdentifyTenantResponse(
+            tenant_found=True,
+            tenant_name=tenant.name,
+            tenant_id=str(tenant.id),
+            keycloak_auth_url=_build_auth_url(tenant.keycloak_idp_alias),
+        )
+        _tenant_cache[identifier] = response
+    return response
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime, matching the DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def _touch_last_login(
+    user_id: uuid.UUID, keycloak_user_id: str, last_login: datetime
+) -> None:
+    """
+    Persist a user's last login time outside the request critical path.
+
+    Args:
+        user_id: Database ID of the user
+        keycloak_user_id: Keycloak user ID, used to drop the cached user
+        last_login: Login timestamp to store
+    """
+    db = db_connection.get_session()
+    try:
+        await db.execute(
+            update(User).where(User.id == user_id).values(last_login=last_login)
+        )
+        await db.commit()
+        invalidate_cached_user(keycloak_user_id)
+    except Exception as e:
+        logger.error("Error updating last login for user %s: %s", user_id, e)
+        await db.rollback()
+    finally:
+        await db.close()
+
 
 @router.post(
     "/identify-tenant",
@@ -34,7 +144,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     description="Identifies the tenant based on department identifier and returns Keycloak auth URL",
 )
 async def identify_tenant(
-    request: IdentifyTenantRequest, db: Session = Depends(get_db)
+    request: IdentifyTenantRequest, db: AsyncSession = Depends(get_db)
 ) -> IdentifyTenantResponse:
     """
     Identify tenant by department and generate Keycloak authentication URL.
@@ -48,45 +158,22 @@ async def identify_tenant(
     """
     try:
         # Find tenant by identifier (department)
-        tenant = (
-            db.query(Tenant)
-            .filter(
-                Tenant.identifier == request.department, Tenant.status == "active"
-            )
-            .first()
-        )
-
-        if not tenant:
-            logger.warning(f"Tenant not found for department: {request.department}")
-            return IdentifyTenantResponse(
-                tenant_found=False,
-                tenant_name=None,
-                tenant_id=None,
-                keycloak_auth_url=None,
-            )
+        response = await _identify_tenant(db, request.department)
 
-        # Build Keycloak authorization URL with IDP hint
-        auth_params = {
-            "client_id": settings.KEYCLOAK_CLIENT_ID,
-            "response_type": "code",
-            "redirect_uri": settings.OAUTH_REDIRECT_URI,
-            "kc_idp_hint": tenant.keycloak_idp_alias,
-        }
-        keycloak_auth_url = f"{settings.auth_url}?{urlencode(auth_params)}"
+        if not response:
+            logger.warning("Tenant not found for department: %s", request.department)
+            return _TENANT_NOT_FOUND
 
         logger.info(
-            f"Tenant identified: {tenant.name} for department: {request.department}"
+            "Tenant identified: %s for department: %s",
+            response.tenant_name,
+            request.department,
         )
 
-        return IdentifyTenantResponse(
-            tenant_found=True,
-            tenant_name=tenant.name,
-            tenant_id=str(tenant.id),
-            keycloak_auth_url=keycloak_auth_url,
-        )
+        return response
 
     except Exception as e:
-        logger.error(f"Error identifying tenant: {str(e)}")
+        logger.error("Error identifying tenant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to identify tenant: {str(e)}",
@@ -100,7 +187,7 @@ async def identify_tenant(
     description="Exchanges authorization code for tokens and creates/updates user",
 )
 async def callback(
-    request: CallbackRequest, db: Session = Depends(get_db)
+    request: CallbackRequest, db: AsyncSession = Depends(get_db)
 ) -> TokenResponse:
     """
     Handle OAuth2 callback by exchanging code for tokens and managing user.
@@ -112,6 +199,8 @@ async def callback(
     Returns:
         TokenResponse with access token, refresh token, and user info
     """
+    now = _utcnow()
+
     try:
         # Exchange authorization code for tokens
         token_data = await keycloak_service.exchange_code_for_token(
@@ -125,6 +214,14 @@ async def callback(
         # Decode token to get user info
         decoded_token = await keycloak_service.decode_token(access_token)
 
+        # The token claims normally carry the profile; only ask the userinfo
+        # endpoint when the client scope leaves the email out
+        if not decoded_token.get("email"):
+            user_info = await keycloak_service.get_user_info(access_token)
+            decoded_token = {
+                **user_info, **decoded_token, "email": user_info.get("email")
+            }
+
         # Extract user information from token
         keycloak_user_id = decoded_token.get("sub")
         email = decoded_token.get("email")
@@ -140,10 +237,12 @@ async def callback(
 
         # Find tenant by department identifier
         tenant = (
-            db.query(Tenant)
-            .filter(Tenant.identifier == department, Tenant.status == "active")
-            .first()
-        )
+            await db.execute(
+                select(Tenant).where(
+                    Tenant.identifier == department, Tenant.status == "active"
+                )
+            )
+        ).scalars().first()
 
         if not tenant:
             raise HTTPException(
@@ -153,8 +252,10 @@ async def callback(
 
         # Find or create user
         user = (
-            db.query(User).filter(User.keycloak_user_id == keycloak_user_id).first()
-        )
+            await db.execute(
+                select(User).where(User.keycloak_user_id == keycloak_user_id)
+            )
+        ).scalars().first()
 
         if user:
             # Update existing user
@@ -162,48 +263,33 @@ async def callback(
             user.first_name = first_name
             user.last_name = last_name
             user.department = department
-            user.tenant_id = tenant.id
-            user.last_login = datetime.utcnow()
-            user.updated_at = datetime.utcnow()
-            logger.info(f"Updated existing user: {email}")
+            user.tenant = tenant
+            user.last_login = now
+            user.updated_at = now
+            logger.info("Updated existing user: %s", email)
         else:
             # Create new user
             user = User(
-                tenant_id=tenant.id,
+                tenant=tenant,
                 keycloak_user_id=keycloak_user_id,
                 email=email,
                 first_name=first_name,
                 last_name=last_name,
                 department=department,
                 status="active",
-                last_login=datetime.utcnow(),
+                last_login=now,
             )
             db.add(user)
-            logger.info(f"Created new user: {email}")
+            logger.info("Created new user: %s", email)
 
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        invalidate_cached_user(keycloak_user_id)
 
         # Prepare user response with tenant info
-        tenant_response = TenantResponse(
-            id=str(tenant.id),
-            name=tenant.name,
-            identifier=tenant.identifier,
-            keycloak_idp_alias=tenant.keycloak_idp_alias,
-            status=tenant.status,
-        )
-
-        user_response = UserResponse(
-            id=str(user.id),
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            department=user.department,
-            status=user.status,
-            last_login=user.last_login.isoformat() if user.last_login else None,
-            tenant=tenant_response,
-        )
+        user_response = UserResponse.from_user(user)
 
+        # Keycloak fields are untrusted, so the token response is validated;
+        # the user part comes from database rows and is reused as is
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
@@ -215,8 +301,8 @@ async def callback(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in callback: {str(e)}")
-        db.rollback()
+        logger.error("Error in callback: %s", e)
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Callback processing failed: {str(e)}",
@@ -230,18 +316,23 @@ async def callback(
     description="Exchanges refresh token for new access and refresh tokens",
 )
 async def refresh(
-    request: RefreshTokenRequest, db: Session = Depends(get_db)
+    request: RefreshTokenRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ) -> TokenResponse:
     """
     Refresh access token using refresh token.
 
     Args:
         request: Contains refresh token
+        background_tasks: Runs the last login update after the response
         db: Database session
 
     Returns:
         TokenResponse with new access token, refresh token, and user info
     """
+    now = _utcnow()
+
     try:
         # Refresh the access token
         token_data = await keycloak_service.refresh_access_token(request.refresh_token)
@@ -254,45 +345,31 @@ async def refresh(
         decoded_token = await keycloak_service.decode_token(access_token)
         keycloak_user_id = decoded_token.get("sub")
 
-        # Find user in database
+        # Find user in database along with their tenant
         user = (
-            db.query(User).filter(User.keycloak_user_id == keycloak_user_id).first()
-        )
+            await db.execute(
+                select(User)
+                .options(joinedload(User.tenant))
+                .where(User.keycloak_user_id == keycloak_user_id)
+            )
+        ).scalars().first()
 
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        # Update last login
-        user.last_login = datetime.utcnow()
-        db.commit()
-        db.refresh(user)
-
-        # Get tenant info
-        tenant = db.query(Tenant).filter(Tenant.id == user.tenant_id).first()
+        # Update last login once the response has been sent
+        background_tasks.add_task(_touch_last_login, user.id, keycloak_user_id, now)
 
-        tenant_response = TenantResponse(
-            id=str(tenant.id),
-            name=tenant.name,
-            identifier=tenant.identifier,
-            keycloak_idp_alias=tenant.keycloak_idp_alias,
-            status=tenant.status,
+        user_response = UserResponse.from_user(user).model_copy(
+            update={"last_login": now}
         )
 
-        user_response = UserResponse(
-            id=str(user.id),
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            department=user.department,
-            status=user.status,
-            last_login=user.last_login.isoformat() if user.last_login else None,
-            tenant=tenant_response,
-        )
-
-        logger.info(f"Token refreshed for user: {user.email}")
+        logger.info("Token refreshed for user: %s", user.email)
 
+        # Keycloak fields are untrusted, so the token response is validated;
+        # the user part comes from database rows and is reused as is
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
@@ -304,7 +381,7 @@ async def refresh(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error refreshing token: {str(e)}")
+        logger.error("Error refreshing token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Token refresh failed: {str(e)}",
@@ -318,7 +395,7 @@ async def refresh(
     description="Revokes refresh token and logs out user from Keycloak",
 )
 async def logout(
-    request: LogoutRequest, current_user: User = Depends(get_current_user)
+    request: LogoutRequest, current_user: CurrentUser = Depends(get_current_user)
 ) -> LogoutResponse:
     """
     Logout user by revoking refresh token.
@@ -334,12 +411,12 @@ async def logout(
         # Revoke the refresh token in Keycloak
         await keycloak_service.revoke_token(request.refresh_token)
 
-        logger.info(f"User logged out: {current_user.email}")
+        logger.info("User logged out: %s", current_user.email)
 
         return LogoutResponse(message="Logged out successfully")
 
     except Exception as e:
-        logger.error(f"Error during logout: {str(e)}")
+        logger.error("Error during logout: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Logout failed: {str(e)}",
@@ -353,57 +430,59 @@ async def logout(
     description="Returns information about the authenticated user",
 )
 async def get_me(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> UserResponse:
     """
     Get current authenticated user information.
 
     Args:
         current_user: Authenticated user from token
-        db: Database session
 
     Returns:
         UserResponse with user and tenant information
     """
     try:
-        # Get tenant info
-        tenant = db.query(Tenant).filter(Tenant.id == current_user.tenant_id).first()
-
-        if not tenant:
+        if not current_user.tenant:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
             )
 
-        tenant_response = TenantResponse(
-            id=str(tenant.id),
-            name=tenant.name,
-            identifier=tenant.identifier,
-            keycloak_idp_alias=tenant.keycloak_idp_alias,
-            status=tenant.status,
-        )
-
-        user_response = UserResponse(
-            id=str(current_user.id),
-            email=current_user.email,
-            first_name=current_user.first_name,
-            last_name=current_user.last_name,
-            department=current_user.department,
-            status=current_user.status,
-            last_login=current_user.last_login.isoformat()
-            if current_user.last_login
-            else None,
-            tenant=tenant_response,
-        )
+        user_response = UserResponse.from_user(current_user)
 
-        logger.info(f"User info retrieved: {current_user.email}")
+        logger.info("User info retrieved: %s", current_user.email)
 
         return user_response
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting user info: {str(e)}")
+        logger.error("Error getting user info: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve user info: {str(e)}",
         )
+
+
+@router.post(
+    "/tenants/cache/clear",
+    response_model=ClearTenantCacheResponse,
+    summary="Clear tenant cache",
+    description="Drops cached tenant lookups so tenant changes take effect immediately (admin only)",
+)
+async def clear_tenant_cache(
+    current_user: CurrentUser = Depends(get_current_admin),
+) -> ClearTenantCacheResponse:
+    """
+    Clear the cached tenant lookups and their Keycloak authorization URLs.
+
+    Args:
+        current_user: Authenticated user holding the admin role
+
+    Returns:
+        ClearTenantCacheResponse with confirmation message
+    """
+    _tenant_cache.clear()
+
+    logger.info("Tenant cache cleared by user: %s", current_user.email)
+
+    return ClearTenantCacheResponse(message="Tenant cache cleared")
@@ -5,7 +5,8 @@ from app.schemas.auth import (
     TokenResponse,
     RefreshTokenRequest,
     LogoutRequest,
-    LogoutResponse
+    LogoutResponse,
+    ClearTenantCacheResponse
 )
 from app.schemas.user import UserResponse, TenantResponse
 
@@ -17,6 +18,7 @@ __all__ = [
     "RefreshTokenRequest",
     "LogoutRequest",
     "LogoutResponse",
+    "ClearTenantCacheResponse",
     "UserResponse",
     "TenantResponse"
 ]
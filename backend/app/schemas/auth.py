@@ -1,6 +1,6 @@
 """Authentication-related Pydantic schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from app.schemas.user import UserResponse
 
@@ -10,12 +10,15 @@ class IdentifyTenantRequest(BaseModel):
 
     department: str = Field(..., description="Department identifier (e.g., tenant-a, tenant-b)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "department": "tenant-a"
             }
-        }
+        },
+    )
 
 
 class IdentifyTenantResponse(BaseModel):
@@ -26,15 +29,18 @@ class IdentifyTenantResponse(BaseModel):
     tenant_id: Optional[str] = Field(None, description="UUID of the tenant")
     keycloak_auth_url: Optional[str] = Field(None, description="Keycloak authentication URL with IDP hint")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "tenant_found": True,
                 "tenant_name": "Tenant A Corp",
                 "tenant_id": "123e4567-e89b-12d3-a456-426614174000",
                 "keycloak_auth_url": "http://localhost:8080/realms/multi-tenant-app/protocol/openid-connect/auth?client_id=fastapi-backend&response_type=code&redirect_uri=http://localhost:3000/auth/callback&kc_idp_hint=microsoft"
             }
-        }
+        },
+    )
 
 
 class CallbackRequest(BaseModel):
@@ -42,12 +48,15 @@ class CallbackRequest(BaseModel):
 
     code: str = Field(..., description="Authorization code from Keycloak")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "code": "eyJhbGciOiJSUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6..."
             }
-        }
+        },
+    )
 
 
 class TokenResponse(BaseModel):
@@ -59,8 +68,10 @@ class TokenResponse(BaseModel):
     expires_in: int = Field(..., description="Token expiration time in seconds")
     user: UserResponse = Field(..., description="Authenticated user information")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJSUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6...",
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6...",
@@ -79,7 +90,8 @@ class TokenResponse(BaseModel):
                     }
                 }
             }
-        }
+        },
+    )
 
 
 class RefreshTokenRequest(BaseModel):
@@ -87,12 +99,15 @@ class RefreshTokenRequest(BaseModel):
 
     refresh_token: str = Field(..., description="Refresh token to exchange for new access token")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6..."
             }
-        }
+        },
+    )
 
 
 class LogoutRequest(BaseModel):
@@ -100,12 +115,15 @@ class LogoutRequest(BaseModel):
 
     refresh_token: str = Field(..., description="Refresh token to revoke")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCIgOiAiSldUIiwia2lkIiA6..."
             }
-        }
+        },
+    )
 
 
 class LogoutResponse(BaseModel):
@@ -113,9 +131,28 @@ class LogoutResponse(BaseModel):
 
     message: str = Field(..., description="Logout confirmation message")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "message": "Logged out successfully"
             }
-        }
+        },
+    )
+
+
+class ClearTenantCacheResponse(BaseModel):
+    """Response schema for tenant cache invalidation."""
+
+    message: str = Field(..., description="Cache invalidation confirmation message")
+
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "message": "Tenant cache cleared"
+            }
+        },
+    )
@@ -1,21 +1,25 @@
 """User-related Pydantic schemas."""
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
 
 
 class TenantResponse(BaseModel):
     """Response schema for tenant information."""
 
-    id: str = Field(..., description="Tenant UUID")
+    id: UUID = Field(..., description="Tenant UUID")
     name: str = Field(..., description="Tenant display name")
     identifier: str = Field(..., description="Tenant identifier (department)")
     keycloak_idp_alias: Optional[str] = Field(None, description="Keycloak IDP alias")
     status: Optional[str] = Field(None, description="Tenant status")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "name": "Tenant A Corp",
@@ -23,24 +27,46 @@ class TenantResponse(BaseModel):
                 "keycloak_idp_alias": "microsoft",
                 "status": "active"
             }
-        }
+        },
+    )
+
+    @classmethod
+    def from_tenant(cls, tenant: Any) -> "TenantResponse":
+        """
+        Build the response from a trusted tenant object without re-validating.
+
+        Args:
+            tenant: Tenant model or cached tenant snapshot
+
+        Returns:
+            TenantResponse populated from the tenant's attributes
+        """
+        return cls.model_construct(
+            id=tenant.id,
+            name=tenant.name,
+            identifier=tenant.identifier,
+            keycloak_idp_alias=tenant.keycloak_idp_alias,
+            status=tenant.status,
+        )
 
 
 class UserResponse(BaseModel):
     """Response schema for user information."""
 
-    id: str = Field(..., description="User UUID")
+    id: UUID = Field(..., description="User UUID")
     email: str = Field(..., description="User email address")
     first_name: Optional[str] = Field(None, description="User first name")
     last_name: Optional[str] = Field(None, description="User last name")
     department: str = Field(..., description="User department (tenant identifier)")
     status: Optional[str] = Field(None, description="User status")
-    last_login: Optional[str] = Field(None, description="Last login timestamp")
+    last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     tenant: Optional[TenantResponse] = Field(None, description="Associated tenant information")
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "email": "user@domain.com",
@@ -57,4 +83,28 @@ class UserResponse(BaseModel):
                     "status": "active"
                 }
             }
-        }
+        },
+    )
+
+    @classmethod
+    def from_user(cls, user: Any) -> "UserResponse":
+        """
+        Build the response from a trusted user object without re-validating.
+
+        Args:
+            user: User model or cached user snapshot
+
+        Returns:
+            UserResponse populated from the user's attributes and tenant
+        """
+        tenant = user.tenant
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            department=user.department,
+            status=user.status,
+            last_login=user.last_login,
+            tenant=TenantResponse.from_tenant(tenant) if tenant is not None else None,
+        )
@@ -1,10 +1,13 @@
 """Keycloak integration service for OAuth2 and JWT operations."""
 
+import asyncio
 import httpx
 import logging
-from jose import jwt, JWTError
+import jwt
+import orjson
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
+from urllib.parse import quote_plus, urlencode
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -18,9 +21,57 @@ class KeycloakService:
     """
 
     def __init__(self):
-        self._public_key: Optional[str] = None
+        self._public_keys: Dict[str, Any] = {}
+        self._public_key_fetched_at: Optional[datetime] = None
         self._public_key_expiry: Optional[datetime] = None
         self._public_key_cache_duration = timedelta(hours=1)
+        self._public_key_min_refresh_interval = timedelta(seconds=10)
+        self._public_key_lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Endpoint URLs parsed once; httpx re-parses plain strings on every request
+        self._token_url = httpx.URL(settings.token_url)
+        self._logout_url = httpx.URL(settings.logout_url)
+        self._certs_url = httpx.URL(settings.certs_url)
+        self._userinfo_url = httpx.URL(settings.userinfo_url)
+
+        # Constant part of the form bodies, url-encoded once
+        client_credentials = urlencode({
+            "client_id": settings.KEYCLOAK_CLIENT_ID,
+            "client_secret": settings.KEYCLOAK_CLIENT_SECRET,
+        })
+        self._authorization_code_body = (
+            f"grant_type=authorization_code&{client_credentials}".encode()
+        )
+        self._refresh_token_body = f"grant_type=refresh_token&{client_credentials}".encode()
+        self._revoke_body = client_credentials.encode()
+        self._form_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+    def set_http_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """
+        Set the shared HTTP client used for all Keycloak requests.
+
+        The client is owned by the application lifespan, which creates it on
+        startup and closes it on shutdown.
+
+        Args:
+            client: Shared async HTTP client, or None to detach it
+        """
+        self._client = client
+
+    @staticmethod
+    def _form_body(prefix: bytes, **fields: str) -> bytes:
+        """Append url-encoded fields to a pre-encoded form body."""
+        return prefix + "".join(
+            f"&{name}={quote_plus(value)}" for name, value in fields.items()
+        ).encode()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client; raises if the application has not set one."""
+        if self._client is None:
+            raise RuntimeError("Keycloak HTTP client is not initialized")
+        return self._client
 
     async def exchange_code_for_token(
         self, code: str, redirect_uri: str
@@ -39,29 +90,24 @@ class KeycloakService:
             HTTPException: If token exchange fails
         """
         try:
-            data = {
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": redirect_uri,
-                "client_id": settings.KEYCLOAK_CLIENT_ID,
-                "client_secret": settings.KEYCLOAK_CLIENT_SECRET,
-            }
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    settings.token_url, data=data, timeout=10.0
-                )
-                response.raise_for_status()
-                token_data = response.json()
-
-                logger.info("Successfully exchanged authorization code for tokens")
-                return token_data
+            content = self._form_body(
+                self._authorization_code_body, code=code, redirect_uri=redirect_uri
+            )
+
+            response = await self.http_client.post(
+                self._token_url, content=content, headers=self._form_headers
+            )
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
+
+            logger.info("Successfully exchanged authorization code for tokens")
+            return token_data
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error during token exchange: {e.response.text}")
+            logger.error("HTTP error during token exchange: %s", e.response.text)
             raise Exception(f"Token exchange failed: {e.response.text}")
         except Exception as e:
-            logger.error(f"Error exchanging code for token: {str(e)}")
+            logger.error("Error exchanging code for token: %s", e)
             raise Exception(f"Token exchange failed: {str(e)}")
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
@@ -78,28 +124,24 @@ class KeycloakService:
             HTTPException: If token refresh fails
         """
         try:
-            data = {
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": settings.KEYCLOAK_CLIENT_ID,
-                "client_secret": settings.KEYCLOAK_CLIENT_SECRET,
-            }
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    settings.token_url, data=data, timeout=10.0
-                )
-                response.raise_for_status()
-                token_data = response.json()
-
-                logger.info("Successfully refreshed access token")
-                return token_data
+            content = self._form_body(
+                self._refresh_token_body, refresh_token=refresh_token
+            )
+
+            response = await self.http_client.post(
+                self._token_url, content=content, headers=self._form_headers
+            )
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
+
+            logger.info("Successfully refreshed access token")
+            return token_data
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error during token refresh: {e.response.text}")
+            logger.error("HTTP error during token refresh: %s", e.response.text)
             raise Exception(f"Token refresh failed: {e.response.text}")
         except Exception as e:
-            logger.error(f"Error refreshing token: {str(e)}")
+            logger.error("Error refreshing token: %s", e)
             raise Exception(f"Token refresh failed: {str(e)}")
 
     async def revoke_token(self, refresh_token: str) -> bool:
@@ -116,46 +158,103 @@ class KeycloakService:
             HTTPException: If token revocation fails
         """
         try:
-            data = {
-                "token": refresh_token,
-                "client_id": settings.KEYCLOAK_CLIENT_ID,
-                "client_secret": settings.KEYCLOAK_CLIENT_SECRET,
-            }
+            content = self._form_body(self._revoke_body, token=refresh_token)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    settings.logout_url, data=data, timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self.http_client.post(
+                self._logout_url, content=content, headers=self._form_headers
+            )
+            response.raise_for_status()
 
-                logger.info("Successfully revoked refresh token")
-                return True
+            logger.info("Successfully revoked refresh token")
+            return True
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error during token revocation: {e.response.text}")
+            logger.error("HTTP error during token revocation: %s", e.response.text)
             raise Exception(f"Token revocation failed: {e.response.text}")
         except Exception as e:
-            logger.error(f"Error revoking token: {str(e)}")
+            logger.error("Error revoking token: %s", e)
             raise Exception(f"Token revocation failed: {str(e)}")
 
+    async def _refresh_public_keys(self) -> None:
+        """Fetch the realm JWKS and index its parsed public keys by key ID."""
+        response = await self.http_client.get(self._certs_url)
+        response.raise_for_status()
+        jwks = orjson.loads(response.content)
+
+        now = datetime.utcnow()
+        # Parse each JWK once; keys PyJWT cannot use (e.g. encryption keys) are skipped
+        self._public_keys = {
+            key.key_id: key.key for key in jwt.PyJWKSet.from_dict(jwks).keys
+        }
+        self._public_key_fetched_at = now
+        self._public_key_expiry = now + self._public_key_cache_duration
+
+    def _public_keys_need_refresh(self, kid: Optional[str]) -> bool:
+        """Check whether the cached JWKS is expired or lacks the given key ID."""
+        now = datetime.utcnow()
+        if self._public_key_expiry is None or now >= self._public_key_expiry:
+            return True
+        return (
+            kid not in self._public_keys
+            and now - self._public_key_fetched_at >= self._public_key_min_refresh_interval
+        )
+
+    async def _get_public_key(self, kid: Optional[str]) -> Any:
+        """
+        Return the public key for a key ID, refreshing the cached JWKS if needed.
+
+        The JWKS is refetched when the cache expires, or when an unknown key ID
+        shows up (e.g. after a key rotation) and the last fetch is old enough.
+
+        Args:
+            kid: Key ID from the JWT header
+
+        Returns:
+            Public key object used to verify the token signature
+
+        Raises:
+            InvalidTokenError: If no key matches the key ID
+        """
+        if self._public_keys_need_refresh(kid):
+            # Concurrent requests wait for a single fetch instead of each refetching
+            async with self._public_key_lock:
+                if self._public_keys_need_refresh(kid):
+                    await self._refresh_public_keys()
+
+        key = self._public_keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"No signing key found for kid: {kid}")
+        return key
+
     async def decode_token(self, token: str) -> Dict[str, Any]:
+        """
+        Decode and validate a JWT access token against the realm's public keys.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            Dict containing decoded token claims
+
+        Raises:
+            Exception: If token validation fails
+        """
         try:
-            async with httpx.AsyncClient() as client:
-                jwks = (await client.get(settings.certs_url)).json()
+            kid = jwt.get_unverified_header(token).get("kid")
+            public_key = await self._get_public_key(kid)
 
             decoded = jwt.decode(
                 token,
-                jwks,
+                public_key,
                 algorithms=["RS256"],
-                audience=settings.KEYCLOAK_CLIENT_ID,
-                options={"verify_aud": False, "verify_iss": False},
+                options={"verify_aud": False},
             )
 
-            logger.info(f"Successfully decoded token for user: {decoded.get('sub')}")
+            logger.debug("Successfully decoded token for user: %s", decoded.get("sub"))
             return decoded
 
-        except JWTError as e:
-            logger.error(f"JWT validation error: {str(e)}")
+        except jwt.InvalidTokenError as e:
+            logger.error("JWT validation error: %s", e)
             raise Exception(f"Invalid token: {str(e)}")
 
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
@@ -174,23 +273,20 @@ class KeycloakService:
         try:
             headers = {"Authorization": f"Bearer {access_token}"}
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    settings.userinfo_url, headers=headers, timeout=10.0
-                )
-                response.raise_for_status()
-                user_info = response.json()
+            response = await self.http_client.get(self._userinfo_url, headers=headers)
+            response.raise_for_status()
+            user_info = orjson.loads(response.content)
 
-                logger.info(
-                    f"Successfully retrieved user info for: {user_info.get('email')}"
-                )
-                return user_info
+            logger.info(
+                "Successfully retrieved user info for: %s", user_info.get("email")
+            )
+            return user_info
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching user info: {e.response.text}")
+            logger.error("HTTP error fetching user info: %s", e.response.text)
             raise Exception(f"Failed to fetch user info: {e.response.text}")
         except Exception as e:
-            logger.error(f"Error fetching user info: {str(e)}")
+            logger.error("Error fetching user info: %s", e)
             raise Exception(f"Failed to fetch user info: {str(e)}")
 
 
@@ -7,6 +7,7 @@ Usage:
     python init_db.py
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -14,6 +15,8 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import insert, select
+
 from app.db.Database_Connection_ORM import DatabaseConnectionORM, Base
 from app.models.tenant import Tenant
 from app.config import settings
@@ -26,8 +29,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-
-def init_database():
+# Initial tenants, inserted with a single INSERT statement
+SEED_TENANTS = [
+    {
+        "name": "Tenant A Corp",
+        "identifier": "tenant-a",
+        "keycloak_idp_alias": "microsoft",
+        "status": "active",
+    },
+    {
+        "name": "Tenant B Industries",
+        "identifier": "tenant-b",
+        "keycloak_idp_alias": "microsoft",
+        "status": "active",
+    },
+]
+
+
+def create_missing_indexes(connection):
+    """
+    Create model indexes that do not exist yet.
+
+    create_all() skips tables that already exist, so indexes added to the
+    models later are created here for existing databases.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+async def init_database():
     """Initialize database by creating all tables."""
     try:
         logger.info("Initializing database connection...")
@@ -39,19 +70,21 @@ def init_database():
             return False
 
         logger.info("Creating database tables...")
-        Base.metadata.create_all(bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(create_missing_indexes)
 
         logger.info("Database tables created successfully!")
-        logger.info(f"Tables created: {', '.join(Base.metadata.tables.keys())}")
+        logger.info("Tables created: %s", ", ".join(Base.metadata.tables.keys()))
 
         return True
 
     except Exception as e:
-        logger.error(f"Error initializing database: {str(e)}")
+        logger.error("Error initializing database: %s", e)
         return False
 
 
-def seed_data():
+async def seed_data():
     """Seed initial tenant data."""
     try:
         logger.info("Seeding initial data...")
@@ -59,43 +92,50 @@ def seed_data():
         session = db_connection.get_session()
 
         # Check if tenants already exist
-        existing_tenants = session.query(Tenant).count()
-        if existing_tenants > 0:
-            logger.info(f"Database already has {existing_tenants} tenants. Skipping seed.")
-            session.close()
+        has_tenants = await session.scalar(select(select(Tenant.id).exists()))
+        if has_tenants:
+            logger.info("Database already has tenants. Skipping seed.")
+            await session.close()
             return True
 
         # Create tenants
-        tenant_a = Tenant(
-            name="Tenant A Corp",
-            identifier="tenant-a",
-            keycloak_idp_alias="microsoft",
-            status="active",
-        )
-
-        tenant_b = Tenant(
-            name="Tenant B Industries",
-            identifier="tenant-b",
-            keycloak_idp_alias="microsoft",
-            status="active",
+        result = await session.execute(
+            insert(Tenant).returning(Tenant.id, Tenant.name), SEED_TENANTS
         )
-
-        session.add(tenant_a)
-        session.add(tenant_b)
-        session.commit()
+        created_tenants = result.all()
+        await session.commit()
 
         logger.info("Seed data inserted successfully!")
-        logger.info(f"Created tenant: {tenant_a.name} (ID: {tenant_a.id})")
-        logger.info(f"Created tenant: {tenant_b.name} (ID: {tenant_b.id})")
+        for tenant_id, tenant_name in created_tenants:
+            logger.info("Created tenant: %s (ID: %s)", tenant_name, tenant_id)
 
-        session.close()
+        await session.close()
         return True
 
     except Exception as e:
-        logger.error(f"Error seeding data: {str(e)}")
+        logger.error("Error seeding data: %s", e)
         return False
 
 
+async def initialize() -> bool:
+    """Create tables and seed data on a single event loop."""
+    try:
+        # Initialize database
+        if not await init_database():
+            logger.error("Database initialization failed!")
+            return False
+
+        # Seed data
+        if not await seed_data():
+            logger.error("Data seeding failed!")
+            return False
+
+        return True
+
+    finally:
+        await DatabaseConnectionORM().close()
+
+
 def main():
     """Main execution function."""
     logger.info("=" * 60)
@@ -103,20 +143,13 @@ def main():
     logger.info("=" * 60)
 
     # Display configuration
-    logger.info(f"Database Host: {settings.DB_HOST}")
-    logger.info(f"Database Port: {settings.DB_PORT}")
-    logger.info(f"Database Name: {settings.DB_NAME}")
-    logger.info(f"Database User: {settings.DB_USER}")
+    logger.info("Database Host: %s", settings.DB_HOST)
+    logger.info("Database Port: %s", settings.DB_PORT)
+    logger.info("Database Name: %s", settings.DB_NAME)
+    logger.info("Database User: %s", settings.DB_USER)
     logger.info("-" * 60)
 
-    # Initialize database
-    if not init_database():
-        logger.error("Database initialization failed!")
-        sys.exit(1)
-
-    # Seed data
-    if not seed_data():
-        logger.error("Data seeding failed!")
+    if not asyncio.run(initialize()):
         sys.exit(1)
 
     logger.info("=" * 60)
@@ -1,11 +1,15 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import httpx
 import logging
+from sqlalchemy import inspect
+from typing import List
 
 from app.db.Database_Connection_ORM import DatabaseConnectionORM, Base
 from app.config import settings
 from app.routers import auth_router
+from app.services.keycloak_service import keycloak_service
 
 # Configure logging
 logging.basicConfig(
@@ -14,30 +18,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _find_missing_tables(connection) -> List[str]:
+    """Return the names of model tables that do not exist in the database."""
+    inspector = inspect(connection)
+    return [
+        table for table in Base.metadata.tables if not inspector.has_table(table)
+    ]
+
 # Lifespan context
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Multi-Tenant Auth API...")
-    logger.info(f"Keycloak URL: {settings.KEYCLOAK_URL}")
-    logger.info(f"Keycloak Realm: {settings.KEYCLOAK_REALM}")
-    logger.info(f"CORS Origins: {settings.cors_origins_list}")
+    logger.info("Keycloak URL: %s", settings.KEYCLOAK_URL)
+    logger.info("Keycloak Realm: %s", settings.KEYCLOAK_REALM)
+    logger.info("CORS Origins: %s", settings.cors_origins_list)
+    logger.info(
+        "DB pool: size=%s, max_overflow=%s, timeout=%ss, recycle=%ss, pre_ping=%s",
+        settings.DB_POOL_SIZE,
+        settings.DB_MAX_OVERFLOW,
+        settings.DB_POOL_TIMEOUT,
+        settings.DB_POOL_RECYCLE,
+        settings.DB_POOL_PRE_PING,
+    )
 
     # Initialize database
     db_connection = DatabaseConnectionORM()
     engine = db_connection.get_engine()
 
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
+    # Schema is created by init_db.py; only check that it is there
+    async with engine.connect() as conn:
+        missing_tables = await conn.run_sync(_find_missing_tables)
+    if missing_tables:
+        raise RuntimeError(
+            f"Database schema is not initialized (missing tables: "
+            f"{', '.join(missing_tables)}). Run `python init_db.py` first."
+        )
+    logger.info("Database schema found")
 
     app.state.db_connection = db_connection
 
+    # Shared HTTP client so Keycloak calls reuse pooled keep-alive connections
+    # HTTP/2 is negotiated over TLS; plain-HTTP Keycloak stays on HTTP/1.1
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    keycloak_service.set_http_client(app.state.http)
+
     yield
 
     logger.info("Shutting down Multi-Tenant Auth API...")
-    db_connection.close()
+    keycloak_service.set_http_client(None)
+    await app.state.http.aclose()
+    await db_connection.close()
 
 # Initialize FastAPI app
+# No custom default_response_class (e.g. ORJSONResponse): routes with a
+# response_model are serialized straight to JSON bytes by pydantic-core, and a
+# custom response class would turn that fast path off.
 app = FastAPI(
     title="Multi-Tenant Auth API",
     description="FastAPI backend with Keycloak authentication for multi-tenant applications",
@@ -61,6 +100,9 @@ app.add_middleware(
 # Include routers
 app.include_router(auth_router)
 
+# Static body, serialized once
+HEALTH_RESPONSE_BODY = b'{"status":"healthy","service":"multi-tenant-auth-api"}'
+
 @app.get("/health", tags=["Health"])
 async def health_check():
-    return {"status": "healthy", "service": "multi-tenant-auth-api"}
\ No newline at end of file
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""Shared pytest configuration for the backend tests."""
+
+import os
+
+# Settings require a client secret; tests never reach Keycloak
+os.environ.setdefault("KEYCLOAK_CLIENT_SECRET", "test-secret")
@@ -0,0 +1,140 @@
+"""Tests for the decoded token cache and its shared in-flight verification."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+from app import dependencies
+
+
+class FakeDecoder:
+    """Stand-in for keycloak_service.decode_token that counts calls."""
+
+    def __init__(self, exp_in: float = 300, error: Optional[Exception] = None):
+        self.calls = 0
+        self.exp_in = exp_in
+        self.error = error
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, token: str):
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"sub": "user-1", "exp": time.time() + self.exp_in}
+
+
+@pytest.fixture(autouse=True)
+def clear_token_state():
+    dependencies._token_cache.clear()
+    dependencies._token_inflight.clear()
+    yield
+    dependencies._token_cache.clear()
+    dependencies._token_inflight.clear()
+
+
+def _use_decoder(monkeypatch, decoder: FakeDecoder) -> None:
+    monkeypatch.setattr(dependencies.keycloak_service, "decode_token", decoder)
+
+
+def test_concurrent_misses_share_one_verification(monkeypatch):
+    async def scenario():
+        decoder = FakeDecoder()
+        _use_decoder(monkeypatch, decoder)
+
+        tasks = [
+            asyncio.create_task(dependencies.decode_token_cached("token"))
+            for _ in range(20)
+        ]
+        await decoder.started.wait()
+        decoder.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert decoder.calls == 1
+        assert all(claims["sub"] == "user-1" for claims in results)
+        assert dependencies._token_inflight == {}
+
+        # Later requests are served from the cache
+        await dependencies.decode_token_cached("token")
+        assert decoder.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_failure_reaches_every_waiter_and_is_not_cached(monkeypatch):
+    async def scenario():
+        decoder = FakeDecoder(error=Exception("Invalid token: bad signature"))
+        _use_decoder(monkeypatch, decoder)
+
+        tasks = [
+            asyncio.create_task(dependencies.decode_token_cached("token"))
+            for _ in range(5)
+        ]
+        await decoder.started.wait()
+        decoder.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert decoder.calls == 1
+        assert all(str(result) == "Invalid token: bad signature" for result in results)
+        assert len(dependencies._token_cache) == 0
+        assert dependencies._token_inflight == {}
+
+        # The next request verifies again instead of reusing the failure
+        with pytest.raises(Exception, match="bad signature"):
+            await dependencies.decode_token_cached("token")
+        assert decoder.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_waiter_takes_over_when_owner_is_cancelled(monkeypatch):
+    async def scenario():
+        decoder = FakeDecoder()
+        _use_decoder(monkeypatch, decoder)
+
+        owner = asyncio.create_task(dependencies.decode_token_cached("token"))
+        await decoder.started.wait()
+        waiter = asyncio.create_task(dependencies.decode_token_cached("token"))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        await asyncio.sleep(0)
+        decoder.release.set()
+
+        claims = await waiter
+        assert claims["sub"] == "user-1"
+        assert owner.cancelled()
+        assert decoder.calls == 2
+        assert dependencies._token_inflight == {}
+
+    asyncio.run(scenario())
+
+
+def test_cache_entry_never_outlives_exp(monkeypatch):
+    async def scenario():
+        decoder = FakeDecoder(exp_in=5)
+        decoder.release.set()
+        _use_decoder(monkeypatch, decoder)
+        clock = SimpleNamespace(now=time.time())
+        monkeypatch.setattr(
+            dependencies, "time", SimpleNamespace(time=lambda: clock.now)
+        )
+
+        claims = await dependencies.decode_token_cached("token")
+        ((expires_at, _),) = dependencies._token_cache.values()
+        assert expires_at <= claims["exp"]
+
+        clock.now = claims["exp"] - 1
+        await dependencies.decode_token_cached("token")
+        assert decoder.calls == 1
+
+        clock.now = claims["exp"]
+        await dependencies.decode_token_cached("token")
+        assert decoder.calls == 2
+
+    asyncio.run(scenario())
@@ -1,5 +1,6 @@
 """Service configuration settings."""
 
+from functools import cached_property
 from pydantic_settings import BaseSettings
 
 
@@ -24,12 +25,12 @@ class Settings(BaseSettings):
     APP_HOST: str = "0.0.0.0"
     APP_PORT: int = 8002
 
-    @property
+    @cached_property
     def certs_url(self) -> str:
         """Keycloak certs endpoint URL for JWT validation."""
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}/protocol/openid-connect/certs"
 
-    @property
+    @cached_property
     def KEYCLOAK_ISSUER(self) -> str:
         """Keycloak issuer URL."""
         return f"{self.KEYCLOAK_URL}/realms/{self.KEYCLOAK_REALM}"
@@ -2,10 +2,16 @@
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+import jwt
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import asyncio
+import hashlib
 import httpx
 import logging
-from typing import Dict, Any
+import orjson
+import time
+from typing import Dict, Any, Optional, Tuple
 
 from config import settings
 
@@ -14,13 +20,164 @@ logger = logging.getLogger(__name__)
 # Security scheme for Bearer token
 security = HTTPBearer()
 
+# Shared HTTP client, created and closed by the application lifespan
+_http_client: Optional[httpx.AsyncClient] = None
 
-async def decode_token(token: str) -> Dict[str, Any]:
+# Realm JWKS cache, indexed by key ID
+JWKS_CACHE_DURATION = timedelta(hours=1)
+JWKS_MIN_REFRESH_INTERVAL = timedelta(seconds=10)
+_jwks_cache: Optional[Dict[str, Any]] = None
+_jwks_fetched_at: Optional[datetime] = None
+_jwks_expiry: Optional[datetime] = None
+_jwks_lock: Optional[asyncio.Lock] = None
+
+# LRU cache of verified tokens: token digest -> (exp, claims)
+TOKEN_CACHE_MAX_SIZE = 10000
+TOKEN_CACHE_EXPIRY_MARGIN = 5  # seconds
+_token_cache: OrderedDict[bytes, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+
+def set_http_client(client: Optional[httpx.AsyncClient]) -> None:
+    """
+    Set the shared HTTP client used for Keycloak requests.
+
+    Args:
+        client: Shared async HTTP client, or None to detach it
+    """
+    global _http_client
+    _http_client = client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client; raises if the lifespan has not set one."""
+    if _http_client is None:
+        raise RuntimeError("HTTP client is not initialized")
+    return _http_client
+
+
+async def _refresh_jwks() -> None:
+    """Fetch the realm JWKS and index its parsed public keys by key ID."""
+    global _jwks_cache, _jwks_fetched_at, _jwks_expiry
+
+    response = await get_http_client().get(settings.certs_url)
+    response.raise_for_status()
+    jwks = orjson.loads(response.content)
+
+    now = datetime.utcnow()
+    # Parse each JWK once; keys PyJWT cannot use (e.g. encryption keys) are skipped
+    _jwks_cache = {key.key_id: key.key for key in jwt.PyJWKSet.from_dict(jwks).keys}
+    _jwks_fetched_at = now
+    _jwks_expiry = now + JWKS_CACHE_DURATION
+
+
+def _jwks_needs_refresh(kid: Optional[str]) -> bool:
+    """Check whether the cached JWKS is expired or lacks the given key ID."""
+    now = datetime.utcnow()
+    if _jwks_cache is None or now >= _jwks_expiry:
+        return True
+    return kid not in _jwks_cache and now - _jwks_fetched_at >= JWKS_MIN_REFRESH_INTERVAL
+
+
+async def get_public_key(kid: Optional[str]) -> Any:
+    """
+    Return the public key for a key ID, refreshing the cached JWKS if needed.
+
+    Args:
+        kid: Key ID from the JWT header
+
+    Returns:
+        Public key object used to verify the token signature
+
+    Raises:
+        InvalidTokenError: If no key matches the key ID
+    """
+    global _jwks_lock
+
+    if _jwks_needs_refresh(kid):
+        # Created lazily so the lock binds to the server's event loop
+        if _jwks_lock is None:
+            _jwks_lock = asyncio.Lock()
+        async with _jwks_lock:
+            if _jwks_needs_refresh(kid):
+                await _refresh_jwks()
+
+    key = _jwks_cache.get(kid)
+    if key is None:
+        raise jwt.InvalidTokenError(f"No signing key found for kid: {kid}")
+    return key
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash a token into a compact cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def get_cached_claims(key: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Return the claims of a previously verified token, if still valid.
+
+    Args:
+        key: Cache key from _token_cache_key
+
+    Returns:
+        Dict containing the cached claims, or None on a miss or near expiry
+    """
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    exp, claims = entry
+    if exp <= time.time() + TOKEN_CACHE_EXPIRY_MARGIN:
+        del _token_cache[key]
+        return None
+
+    _token_cache.move_to_end(key)
+    return claims
+
+
+def cache_claims(key: bytes, claims: Dict[str, Any]) -> None:
+    """
+    Store the claims of a verified token until its expiry.
+
+    Args:
+        key: Cache key from _token_cache_key
+        claims: Decoded token claims
+    """
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+
+    _token_cache[key] = (exp, claims)
+    _token_cache.move_to_end(key)
+    while len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+        _token_cache.popitem(last=False)
+
+
+def get_cached_public_key(kid: Optional[str]) -> Any:
+    """
+    Return the cached public key for a key ID without touching the network.
+
+    Args:
+        kid: Key ID from the JWT header
+
+    Returns:
+        Public key object, or None if the JWKS has to be (re)fetched first
+    """
+    if _jwks_needs_refresh(kid):
+        return None
+    return _jwks_cache.get(kid)
+
+
+def decode_token(token: str, public_key: Any) -> Dict[str, Any]:
     """
     Decode and validate JWT token from Keycloak.
 
+    Verification is CPU-only, so this is a plain function: callers resolve the
+    signing key first (see get_cached_public_key / get_public_key).
+
     Args:
         token: JWT access token
+        public_key: Public key matching the token's key ID
 
     Returns:
         Dict containing decoded token claims
@@ -29,22 +186,18 @@ async def decode_token(token: str) -> Dict[str, Any]:
         Exception: If token validation fails
     """
     try:
-        async with httpx.AsyncClient() as client:
-            jwks = (await client.get(settings.certs_url)).json()
-
         decoded = jwt.decode(
             token,
-            jwks,
+            public_key,
             algorithms=["RS256"],
-            audience=settings.KEYCLOAK_CLIENT_ID,
-            options={"verify_aud": False, "verify_iss": False},
+            options={"verify_aud": False},
         )
 
-        logger.info(f"Successfully decoded token for user: {decoded.get('sub')}")
+        logger.debug("Successfully decoded token for user: %s", decoded.get("sub"))
         return decoded
 
-    except JWTError as e:
-        logger.error(f"JWT validation error: {str(e)}")
+    except jwt.InvalidTokenError as e:
+        logger.error("JWT validation error: %s", e)
         raise Exception(f"Invalid token: {str(e)}")
 
 
@@ -66,8 +219,20 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        # Decode and validate token
-        decoded_token = await decode_token(token)
+        # A token seen before skips signature verification until it expires
+        cache_key = _token_cache_key(token)
+        decoded_token = get_cached_claims(cache_key)
+
+        if decoded_token is None:
+            # Only a stale JWKS or an unseen key ID costs an await
+            kid = jwt.get_unverified_header(token).get("kid")
+            public_key = get_cached_public_key(kid)
+            if public_key is None:
+                public_key = await get_public_key(kid)
+
+            # Decode and validate token
+            decoded_token = decode_token(token, public_key)
+            cache_claims(cache_key, decoded_token)
 
         # Extract user information
         user_id = decoded_token.get("sub")
@@ -80,13 +245,13 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        logger.info(f"Authenticated user: {email}")
+        logger.debug("Authenticated user: %s", email)
         return decoded_token
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Authentication error: {str(e)}")
+        logger.error("Authentication error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Authentication failed: {str(e)}",
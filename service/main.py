@@ -1,9 +1,12 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+import httpx
 import logging
 from typing import Dict, Any
 
-from dependencies import get_current_user
+from dependencies import get_current_user, set_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -12,6 +15,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Static body, serialized once
+HEALTH_RESPONSE_BODY = b'{"status":"healthy","service":"Service API is running"}'
+
+SAMPLE_DATA = [
+    {"id": 1, "name": "Item 1", "description": "Sample data 1"},
+    {"id": 2, "name": "Item 2", "description": "Sample data 2"},
+    {"id": 3, "name": "Item 3", "description": "Sample data 3"},
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared HTTP client so JWKS fetches reuse pooled keep-alive connections
+    # HTTP/2 is negotiated over TLS; plain-HTTP Keycloak stays on HTTP/1.1
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    set_http_client(app.state.http)
+
+    yield
+
+    set_http_client(None)
+    await app.state.http.aclose()
+
+
 app = FastAPI(
     title="Service API",
     description="Protected FastAPI Service with JWT validation",
@@ -20,6 +50,8 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     root_path="/service",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -35,7 +67,7 @@ app.add_middleware(
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Public health check endpoint."""
-    return {"status": "healthy", "service": "Service API is running"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/protected", tags=["Protected"])
@@ -49,7 +81,9 @@ async def protected_endpoint(current_user: Dict[str, Any] = Depends(get_current_
     Returns:
         User information from token
     """
-    return {
+    # Returned as a response directly: the payload is plain JSON types, so
+    # FastAPI's jsonable_encoder pass is skipped
+    return ORJSONResponse({
         "message": "Access granted to protected resource",
         "user": {
             "id": current_user.get("sub"),
@@ -58,7 +92,7 @@ async def protected_endpoint(current_user: Dict[str, Any] = Depends(get_current_
             "given_name": current_user.get("given_name"),
             "family_name": current_user.get("family_name"),
         }
-    }
+    })
 
 
 @app.get("/data", tags=["Data"])
@@ -72,11 +106,7 @@ async def get_data(current_user: Dict[str, Any] = Depends(get_current_user)):
     Returns:
         Sample data for authenticated user
     """
-    return {
-        "data": [
-            {"id": 1, "name": "Item 1", "description": "Sample data 1"},
-            {"id": 2, "name": "Item 2", "description": "Sample data 2"},
-            {"id": 3, "name": "Item 3", "description": "Sample data 3"},
-        ],
+    return ORJSONResponse({
+        "data": SAMPLE_DATA,
         "user_email": current_user.get("email"),
-    }
\ No newline at end of file
+    })
\ No newline at end of file